@@ -0,0 +1,400 @@
+# coding: utf-8
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from PyTools import PythonChecker, SmartFormatter, PyToolsBase, Logger, FS, SevenZipper, ProcessHelper
+from TestLog import Logger_
+
+MIN_PYTHON_VERSION = (3, 8)
+NAME = 'Benchmark'
+DESCRIPTION = 'This tool measures the logging, file system and archive hot paths and stores the results as JSON.'
+VERSION = '0.1.0.0 - 19.10.2026'
+
+LF = '\n'
+
+
+# ######################################################################################################################
+# Class of the defines
+class Defines:
+    # Default output file of the results
+    DEFAULT_OUTPUT: str = 'benchmark.json'
+
+    # Default relative slow down of a benchmark to be reported as a regression
+    DEFAULT_THRESHOLD: float = 0.2
+
+    # Terminal heights used for the split screen logger
+    TERM_HEIGHTS: tuple = (20, 50, 100)
+    TERM_WIDTH: int = 120
+
+    # Minimum time and number of the repetitions for a reliable comparison with a baseline
+    MIN_TIME: float = 0.01
+    MIN_REPEAT: int = 3
+
+    # Script of the stub 7zip executable. It prints canned output files, so no interpreter is started per call.
+    STUB_7Z: str = '''#!/bin/sh
+case "$1" in
+    --help) exec cat "{dir}/out_help.txt" ;;
+    l) exec cat "{dir}/out_list.txt" ;;
+    e) exec cat "{dir}/out_extract.txt" ;;
+esac
+'''
+    STUB_7Z_HELP: str = LF + '7-Zip 16.02 : Copyright (c) 1999-2016 Igor Pavlov : 2016-05-21' + LF
+    STUB_7Z_EXTRACT: str = 'Everything is Ok' + LF + LF + 'Size:       1024' + LF
+
+
+# ######################################################################################################################
+# Class for running benchmarks and collecting their timings
+class BenchmarkRunner(PyToolsBase):
+    # General information
+    _NAME = 'Benchmark Runner'
+    _DESCRIPTION = 'The class runs timed benchmarks and collects the results.'
+    _VERSION = '0.1.0.0 - 19.10.2026'
+
+    # ##################################################################################################################
+    def __init__(self, repeat: int, scale: float, name_patt: str = r'.*'):
+        """
+        :param repeat:      The number of timed repetitions of each benchmark.
+        :param scale:       The factor applied to the number of calls per repetition.
+        :param name_patt:   Only benchmarks whose name matches the regular expression are run.
+        :return:            None
+        """
+        # Initialize the base class
+        PyToolsBase.__init__(self, self._NAME, self._VERSION, self._DESCRIPTION)
+
+        self._repeat: int = repeat
+        self._scale: float = scale
+        self._rx_name: re = re.compile(name_patt)
+        self.results: list = list()
+
+    # ##################################################################################################################
+    def enabled(self, name: str) -> bool:
+        return True if self._rx_name.search(name) else False
+
+    # ##################################################################################################################
+    def time(self, name: str, params: dict, func, number: int, min_number: int = 1):
+        """
+        :param name:        The name of the benchmark.
+        :param params:      The parameters of the benchmark, they are part of its key in the results.
+        :param func:        The function to be timed, it is called with the call index.
+        :param number:      The number of calls per repetition (before scaling).
+        :param min_number:  The minimum number of calls per repetition regardless of the scaling.
+        :return:            None
+        """
+        number = max(min_number, int(number * self._scale))
+
+        # Warm up once, then time each repetition
+        func(0)
+        timings: list = list()
+        for _ in range(self._repeat):
+            start: float = time.perf_counter()
+            for i in range(number):
+                func(i)
+            timings.append(time.perf_counter() - start)
+
+        best: float = min(timings)
+        self.results.append({'name': name, 'params': params, 'number': number, 'repeat': self._repeat,
+                             'best': best, 'median': statistics.median(timings), 'mean': statistics.mean(timings),
+                             'worst': max(timings), 'per_call': best / number})
+        sys.stderr.write('{0:<32} {1:<48} {2:>12.3f} us/call'.format(name, json.dumps(params), 1e6 * best / number) + LF)
+
+
+# ######################################################################################################################
+@contextlib.contextmanager
+def nullSink():
+    with open(os.devnull, 'w') as fh, contextlib.redirect_stdout(fh):
+        yield
+
+
+# ######################################################################################################################
+@contextlib.contextmanager
+def ptySink():
+    # The pseudo terminal has to be drained, otherwise writing blocks as soon as its buffer is full
+    master, slave = os.openpty()
+
+    def drain():
+        try:
+            while os.read(master, 64 * 1024):
+                pass
+        except OSError:
+            pass
+
+    drainer = threading.Thread(target=drain, daemon=True)
+    drainer.start()
+    with os.fdopen(slave, 'w') as fh, contextlib.redirect_stdout(fh):
+        yield
+    drainer.join(1.0)
+    os.close(master)
+
+
+# ######################################################################################################################
+@contextlib.contextmanager
+def terminalSize(width: int, height: int):
+    # The terminal size is taken from the environment first (see shutil.get_terminal_size)
+    saved: dict = {key: os.environ.get(key) for key in ('COLUMNS', 'LINES')}
+    os.environ['COLUMNS'], os.environ['LINES'] = str(width), str(height)
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            os.environ.pop(key) if value is None else os.environ.__setitem__(key, value)
+
+
+# ######################################################################################################################
+def benchLogger(runner: BenchmarkRunner, tmp_dir: str):
+    if not runner.enabled('Logger._log'):
+        return
+
+    for log_on in (True, False):
+        for sink in ('none', 'file', 'file+structured'):
+            logger: Logger = Logger()
+            logger.setLogOn(log_on)
+            if sink != 'none':
+                logger.setLogFile(os.path.join(tmp_dir, 'logger.log'))
+            if sink == 'file+structured':
+                logger.setStructuredLogFile(os.path.join(tmp_dir, 'logger.jsonl'))
+            with nullSink():
+                runner.time('Logger._log', {'console': log_on, 'sink': sink},
+                            lambda i: logger.logInfo('Benchmark message number {0}'.format(i)), 2000)
+            logger.setStructuredLogFile('')
+
+
+# ######################################################################################################################
+def benchLoggerProgress(runner: BenchmarkRunner, tmp_dir: str):
+    if not runner.enabled('Logger.progress'):
+        return
+
+    for log_on in (True, False):
+        logger: Logger = Logger()
+        logger.setLogOn(log_on)
+        logger.setLogFile(os.path.join(tmp_dir, 'progress.log'))
+        total: int = 100000
+        with nullSink():
+            runner.time('Logger.progress', {'console': log_on, 'total': total},
+                        lambda i: logger.progress(i % total, total, 'Progress...'), 20000)
+
+
+# ######################################################################################################################
+def benchSplitScreenLogger(runner: BenchmarkRunner, tmp_dir: str):
+    for sink_name, sink in (('null', nullSink), ('pty', ptySink)):
+        for height in Defines.TERM_HEIGHTS:
+            params: dict = {'sink': sink_name, 'height': height}
+            with terminalSize(Defines.TERM_WIDTH, height), sink():
+                logger: Logger_ = Logger_(3)
+
+                # The body is filled beyond the screen height at any scale, so the scrolling path is measured
+                if runner.enabled('Logger_.log'):
+                    runner.time('Logger_.log', params, lambda i: logger.log('{0} BODY'.format(i)), 2 * height + 500,
+                                2 * height)
+                if runner.enabled('Logger_.logTail'):
+                    runner.time('Logger_.logTail', params, lambda i: logger.logTail(i % 3, 'Index: {0}'.format(i)), 5000)
+
+
+# ######################################################################################################################
+def makeTree(root: str, depth: int, fan_out: int, files_per_dir: int, file_size: int) -> int:
+    # Create a synthetic directory tree with deterministic content and return the number of files
+    data: bytes = bytes(range(256)) * (file_size // 256 + 1)
+    nb_files: int = 0
+    dirs: list = [root]
+    for level in range(depth + 1):
+        next_dirs: list = list()
+        for dir_name in dirs:
+            os.makedirs(dir_name, exist_ok=True)
+            for i in range(files_per_dir):
+                ext: str = '.log' if i % 2 else '.txt'
+                open(os.path.join(dir_name, 'file_{0:04d}{1}'.format(i, ext)), 'wb').write(data[:file_size])
+                nb_files += 1
+            if level < depth:
+                next_dirs.extend(os.path.join(dir_name, 'dir_{0:02d}'.format(i)) for i in range(fan_out))
+        dirs = next_dirs
+
+    return nb_files
+
+
+# ######################################################################################################################
+def benchFS(runner: BenchmarkRunner, tmp_dir: str):
+    if runner.enabled('FS.collectAllFiles'):
+        for depth, fan_out, files_per_dir in ((1, 4, 250), (3, 4, 20)):
+            root: str = os.path.join(tmp_dir, 'tree_{0}_{1}_{2}'.format(depth, fan_out, files_per_dir))
+            nb_files: int = makeTree(root, depth, fan_out, files_per_dir, 16)
+            for patt in (r'.*', r'.*\.log$'):
+                params: dict = {'depth': depth, 'fan_out': fan_out, 'files': nb_files, 'pattern': patt}
+                runner.time('FS.collectAllFiles', params, lambda i: FS.collectAllFiles(root, file_name_patt=patt), 5)
+
+    if runner.enabled('FS.md5'):
+        for file_size in (4 * 1024, 1024 * 1024, 16 * 1024 * 1024):
+            file_name: str = os.path.join(tmp_dir, 'md5_{0}.bin'.format(file_size))
+            open(file_name, 'wb').write(os.urandom(file_size))
+            number: int = max(1, (64 * 1024 * 1024) // file_size // 4)
+            runner.time('FS.md5', {'size': file_size}, lambda i: FS.md5(file_name), min(number, 1000))
+
+
+# ######################################################################################################################
+@contextlib.contextmanager
+def cannedOutput(lines: list):
+    # Replace the process call of the SevenZipper by the captured output, so only the parsing is measured
+    run_cmd = ProcessHelper.__dict__['runCmd']
+    ProcessHelper.runCmd = staticmethod(lambda cmd: lines)
+    try:
+        yield
+    finally:
+        ProcessHelper.runCmd = run_cmd
+
+
+# ######################################################################################################################
+def makeStub7z(stub_dir: str, nb_files: int) -> str:
+    # Create the stub 7zip executable and its canned output
+    os.makedirs(stub_dir, exist_ok=True)
+    list_str: str = ''.join('Path = dir/file_{0:05d}.log'.format(i) + LF + 'Size = 1024' + LF + LF for i in range(nb_files))
+    open(os.path.join(stub_dir, 'out_help.txt'), 'w').write(Defines.STUB_7Z_HELP)
+    open(os.path.join(stub_dir, 'out_list.txt'), 'w').write(list_str)
+    open(os.path.join(stub_dir, 'out_extract.txt'), 'w').write(Defines.STUB_7Z_EXTRACT)
+    stub: str = os.path.join(stub_dir, SevenZipper.DEFAULT_PROG_NAME)
+    open(stub, 'w').write(Defines.STUB_7Z.format(dir=stub_dir))
+    os.chmod(stub, 0o755)
+
+    return stub
+
+
+# ######################################################################################################################
+def benchSevenZipper(runner: BenchmarkRunner, tmp_dir: str):
+    if platform.system() == 'Windows' or not runner.enabled('SevenZipper'):
+        return
+
+    out_dir: str = os.path.join(tmp_dir, 'extract')
+    os.makedirs(out_dir, exist_ok=True)
+    for nb_files in (10, 1000, 10000):
+        stub_dir: str = os.path.join(tmp_dir, 'stub_7z_{0}'.format(nb_files))
+        stub: str = makeStub7z(stub_dir, nb_files)
+        zipper: SevenZipper = SevenZipper(prog_path=stub_dir)
+        params: dict = {'files': nb_files}
+
+        # End to end including the process start of the stub
+        if runner.enabled('SevenZipper.init'):
+            runner.time('SevenZipper.init', params, lambda i: SevenZipper(prog_path=stub_dir), 5)
+        if runner.enabled('SevenZipper.findFiles'):
+            runner.time('SevenZipper.findFiles', params, lambda i: zipper.findFiles('stub.7z', '*_00[0-4]??.log'), 10)
+        if runner.enabled('SevenZipper.extract1stFile'):
+            runner.time('SevenZipper.extract1stFile', params, lambda i: zipper.extract1stFile('stub.7z', '*.log', out_dir), 10)
+
+        # Parsing of the captured output only
+        if runner.enabled('SevenZipper.parseList'):
+            with cannedOutput(ProcessHelper.runCmd([stub, 'l', '-slt', 'stub.7z'])):
+                runner.time('SevenZipper.parseList', params, lambda i: zipper.findFiles('stub.7z', '*_00[0-4]??.log'), 20)
+        if runner.enabled('SevenZipper.parseExtract'):
+            with cannedOutput(ProcessHelper.runCmd([stub, 'e', 'stub.7z', '-o' + out_dir, 'dir/file_00000.log'])):
+                runner.time('SevenZipper.parseExtract', params,
+                            lambda i: zipper.extractFile('stub.7z', 'dir/file_00000.log', out_dir), 20000)
+
+
+# ######################################################################################################################
+def checkBaseline(baseline_file: str, repeat: int, scale: float) -> dict:
+    # A baseline is only comparable if it measured the same number of calls and repetitions
+    baseline: dict = json.load(open(baseline_file, 'r'))
+    meta: dict = baseline.get('meta', dict())
+    if meta.get('repeat') != repeat or meta.get('scale') != scale:
+        raise Exception('The baseline {0} was run with repeat={1} and scale={2}, this run uses repeat={3} and scale={4}.'.format(
+            baseline_file, meta.get('repeat'), meta.get('scale'), repeat, scale))
+
+    return baseline
+
+
+# ######################################################################################################################
+def compareResults(results: list, baseline: dict, threshold: float) -> tuple:
+    # Match the results by name and parameters. A result is reported as regression only if its fastest repetition is
+    # slower than the threshold and than the slowest repetition of the baseline. Too few or too short repetitions are
+    # too noisy to be compared.
+    def key(result: dict) -> str:
+        return result['name'] + json.dumps(result['params'], sort_keys=True)
+
+    base_results: dict = {key(result): result for result in baseline['results']}
+    regressions: list = list()
+    unreliable: list = list()
+    for result in results:
+        base: dict = base_results.get(key(result))
+        if not base:
+            continue
+        if result['repeat'] < Defines.MIN_REPEAT or min(result['best'], base['best']) < Defines.MIN_TIME:
+            unreliable.append({'name': result['name'], 'params': result['params']})
+            continue
+        base_worst: float = base.get('worst', base['best']) / base['number']
+        if result['per_call'] > base['per_call'] * (1.0 + threshold) and result['per_call'] > base_worst:
+            regressions.append({'name': result['name'], 'params': result['params'], 'baseline': base['per_call'],
+                                'current': result['per_call'], 'ratio': result['per_call'] / base['per_call']})
+
+    return regressions, unreliable
+
+
+# ######################################################################################################################
+def parseArgs():
+    parser = argparse.ArgumentParser(description=NAME + ' (' + VERSION + ') - ' + DESCRIPTION, formatter_class=SmartFormatter)
+    parser.add_argument('-o', '--output', default=Defines.DEFAULT_OUTPUT, help='The JSON file the results are written to.')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='The number of timed repetitions of each benchmark.')
+    parser.add_argument('-s', '--scale', type=float, default=1.0,
+                        help='The factor applied to the number of calls per repetition (e.g. 0.1 for a quick run).')
+    parser.add_argument('-f', '--filter', default=r'.*', help='Only run the benchmarks whose name matches the regular expression.')
+    parser.add_argument('-c', '--compare', default=None,
+                        help='R|A JSON file of a previous run with the same repeat and scale to compare with.\n'
+                             'The tool exits with 1 if a benchmark is slower than the threshold.')
+    parser.add_argument('-t', '--threshold', type=float, default=Defines.DEFAULT_THRESHOLD,
+                        help='The relative slow down reported as a regression (default: 0.2 = 20%%).')
+    return parser.parse_args()
+
+
+# ######################################################################################################################
+
+# Main method, entry point
+if __name__ == "__main__":
+    # Check interpreter
+    PythonChecker().check(MIN_PYTHON_VERSION)
+
+    args = parseArgs()
+
+    # Check the baseline before spending the time for the benchmarks
+    baseline_g: dict = None
+    if args.compare:
+        try:
+            baseline_g = checkBaseline(args.compare, args.repeat, args.scale)
+        except Exception as e:
+            sys.stderr.write('[ERROR]: ' + str(e) + LF)
+            sys.exit(2)
+
+    runner_g: BenchmarkRunner = BenchmarkRunner(args.repeat, args.scale, args.filter)
+
+    # Run all benchmarks on generated data in a temporary directory
+    tmp_dir_g: str = tempfile.mkdtemp(prefix='pytools_bench_')
+    try:
+        for bench in (benchLogger, benchLoggerProgress, benchSplitScreenLogger, benchFS, benchSevenZipper):
+            bench(runner_g, tmp_dir_g)
+    finally:
+        shutil.rmtree(tmp_dir_g, ignore_errors=True)
+
+    # Store the results
+    output: dict = {'meta': {'tool': VERSION, 'date': datetime.now().isoformat(timespec='seconds'),
+                             'python': platform.python_version(), 'platform': platform.platform(),
+                             'repeat': args.repeat, 'scale': args.scale},
+                    'results': runner_g.results}
+    if baseline_g:
+        output['regressions'], output['unreliable'] = compareResults(runner_g.results, baseline_g, args.threshold)
+    open(args.output, 'w').write(json.dumps(output, indent=2) + LF)
+    sys.stderr.write('Results written to ' + args.output + LF)
+
+    # Report the regressions
+    if output.get('unreliable'):
+        sys.stderr.write('SKIPPED: {0} benchmarks not compared, they need at least {1} repetitions of {2} s '
+                         '(increase the repeat or the scale)'.format(len(output['unreliable']), Defines.MIN_REPEAT,
+                                                                    Defines.MIN_TIME) + LF)
+    for regression in output.get('regressions', list()):
+        sys.stderr.write('REGRESSION: {0} {1} {2:.2f}x slower'.format(regression['name'], json.dumps(regression['params']),
+                                                                      regression['ratio']) + LF)
+    sys.exit(1 if output.get('regressions') else 0)
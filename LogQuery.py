@@ -0,0 +1,73 @@
+# coding: utf-8
+import argparse
+import json
+import sys
+from datetime import datetime
+
+from PyTools import PythonChecker, SmartFormatter, StructuredLog, StructuredLogReader
+
+MIN_PYTHON_VERSION = (3, 8)
+NAME = 'Log Query'
+DESCRIPTION = 'This tool queries structured log files by time range and level using the sparse sidecar index.'
+VERSION = '0.1.0.0 - 19.10.2026'
+
+LF = '\n'
+
+
+# ######################################################################################################################
+# Class of the defines
+class Defines:
+    # Date format of the time range arguments and of the text output
+    DATE_FORMAT: str = '%d.%m.%Y, %H:%M:%S'
+
+
+# ######################################################################################################################
+def parseTime(value: str) -> float:
+    # Accept either seconds since the epoch or the date format of the logger
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, Defines.DATE_FORMAT).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError('The time "{0}" is neither a number nor of the format "{1}".'.format(
+            value, Defines.DATE_FORMAT))
+
+
+# ######################################################################################################################
+def parseArgs():
+    parser = argparse.ArgumentParser(description=NAME + ' (' + VERSION + ') - ' + DESCRIPTION, formatter_class=SmartFormatter)
+    parser.add_argument('log_file', help='The structured log file to be queried.')
+    parser.add_argument('-l', '--level', choices=StructuredLog.LEVELS, default=None,
+                        help='Select only the records of the given level.')
+    parser.add_argument('-s', '--start', type=parseTime, default=None,
+                        help='R|Select only the records at or after the given time.\n'
+                             'Either seconds since the epoch or "dd.mm.YYYY, HH:MM:SS".')
+    parser.add_argument('-e', '--end', type=parseTime, default=None,
+                        help='R|Select only the records at or before the given time.\n'
+                             'Either seconds since the epoch or "dd.mm.YYYY, HH:MM:SS".')
+    parser.add_argument('-j', '--json', action='store_true', help='Output the records as JSON Lines.')
+    return parser.parse_args()
+
+
+# ######################################################################################################################
+
+# Main method, entry point
+if __name__ == "__main__":
+    # Check interpreter
+    PythonChecker().check(MIN_PYTHON_VERSION)
+
+    args = parseArgs()
+    try:
+        with StructuredLogReader(args.log_file) as reader:
+            for record in reader.query(args.start, args.end, args.level):
+                if args.json:
+                    sys.stdout.write(json.dumps(record, ensure_ascii=False) + LF)
+                else:
+                    date_str: str = datetime.fromtimestamp(record['ts']).strftime(Defines.DATE_FORMAT)
+                    span_str: str = ' (' + record['span'] + ')' if record.get('span') else ''
+                    sys.stdout.write('[{0}] [{1}]{2}: {3}'.format(date_str, record['level'], span_str, record.get('msg', '')) + LF)
+    except Exception as e:
+        sys.stderr.write('[ERROR]: ' + str(e) + LF)
+        sys.exit(1)
@@ -0,0 +1,151 @@
+# coding: utf-8
+import argparse
+import re
+import shutil
+import time
+
+from PyTools import PythonChecker, SmartFormatter, PyToolsBase, FileFollower, SimpleSupporter
+from TestLog import Logger_
+
+MIN_PYTHON_VERSION = (3, 8)
+NAME = 'Log Viewer'
+DESCRIPTION = 'This tool follows a growing log file and shows the matching lines in the split screen logger.'
+VERSION = '0.1.0.0 - 19.10.2026'
+
+LF = '\n'
+
+
+# ######################################################################################################################
+# Class of the defines
+class Defines:
+    # Levels written by the Logger
+    LEVELS: tuple = ('INFO', 'WARNING', 'ERROR', 'INFO-FILE')
+
+    # Tail rows of the counters
+    TAIL_COUNTERS: int = 0
+    TAIL_FILE: int = 1
+    TAIL_SIZE: int = 2
+
+
+# ######################################################################################################################
+# Class for following a log file and showing the matching lines with live counters
+class LogViewer(PyToolsBase):
+    # General information
+    _NAME = 'Log Viewer'
+    _DESCRIPTION = 'The class follows a growing log file and filters the new lines into the split screen logger.'
+    _VERSION = '0.1.0.0 - 19.10.2026'
+
+    # Prefix of the error lines, they are counted regardless of the filters
+    _RX_ERROR: re = re.compile(rb'^\[ERROR\]: ')
+
+    # ##################################################################################################################
+    def __init__(self, follower: FileFollower, levels: list = None, patt: str = None, refresh: float = 0.5):
+        """
+        :param follower:    The follower of the log file.
+        :param levels:      Only the lines of these levels are shown, all lines if not given.
+        :param patt:        Only the lines matching the regular expression are shown, all lines if not given.
+        :param refresh:     The interval in seconds the counters are updated in.
+        :return:            None
+        """
+        # Initialize the base class
+        PyToolsBase.__init__(self, self._NAME, self._VERSION, self._DESCRIPTION)
+
+        # The filters are compiled once and applied to the raw bytes, only the shown lines are decoded
+        self._follower: FileFollower = follower
+        self._rx_level: re = re.compile(rb'^\[(?:' + b'|'.join(re.escape(lvl.encode()) for lvl in levels) + rb')\]: ') \
+            if levels else None
+        self._rx_patt: re = re.compile(patt.encode()) if patt else None
+        self._refresh: float = refresh
+
+        # Counters
+        self._lines: int = 0
+        self._shown: int = 0
+        self._errors: int = 0
+        self._bytes: int = 0
+        self._rate_time: float = time.time()
+        self._rate_lines: int = 0
+        self._rate_bytes: int = 0
+
+        self._logger: Logger_ = Logger_(Defines.TAIL_SIZE)
+        self._width: int = shutil.get_terminal_size().columns
+
+    # ##################################################################################################################
+    def run(self):
+        try:
+            while True:
+                lines: list = self._follower.read()
+                if lines:
+                    self.__process__(lines)
+                else:
+                    self._follower.wait(self._refresh)
+
+                # Update the counters at most once per refresh interval
+                if time.time() - self._rate_time >= self._refresh:
+                    self.__logCounters__()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._follower.close()
+
+    # ##################################################################################################################
+    def __process__(self, lines: list):
+        rx_level: re = self._rx_level
+        rx_patt: re = self._rx_patt
+        rx_error: re = self._RX_ERROR
+        shown: list = list()
+        for line in lines:
+            self._bytes += len(line) + 1
+            self._errors += 1 if rx_error.match(line) else 0
+            if rx_level and not rx_level.match(line):
+                continue
+            if rx_patt and not rx_patt.search(line):
+                continue
+            shown.append(line[:self._width].decode('utf-8', 'replace').rstrip('\r'))
+
+        self._lines += len(lines)
+        self._shown += len(shown)
+
+        # Draw all shown lines of the chunk at once
+        self._logger.logLines(shown)
+
+    # ##################################################################################################################
+    def __logCounters__(self):
+        now: float = time.time()
+        elapsed: float = now - self._rate_time
+        lines_s: float = (self._lines - self._rate_lines) / elapsed
+        bytes_s: float = (self._bytes - self._rate_bytes) / elapsed
+        self._rate_time, self._rate_lines, self._rate_bytes = now, self._lines, self._bytes
+        self._width = shutil.get_terminal_size().columns
+
+        self._logger.logTail(Defines.TAIL_COUNTERS, 'Lines: {0} ({1:.0f}/s) | Shown: {2} | Errors: {3} | Bytes: {4} ({5}/s)'.format(
+            self._lines, lines_s, self._shown, self._errors, SimpleSupporter.convTo(self._bytes) if self._bytes else '0 B',
+            SimpleSupporter.convTo(bytes_s) if bytes_s >= 1 else '0 B')[:self._width])
+        self._logger.logTail(Defines.TAIL_FILE, 'Following {0} ({1}) at offset {2}'.format(
+            self._follower.file_name, self._follower.mode, self._follower.offset)[:self._width])
+
+
+# ######################################################################################################################
+def parseArgs():
+    parser = argparse.ArgumentParser(description=NAME + ' (' + VERSION + ') - ' + DESCRIPTION, formatter_class=SmartFormatter)
+    parser.add_argument('log_file', help='The log file to be followed.')
+    parser.add_argument('-l', '--level', nargs='+', choices=Defines.LEVELS, default=None,
+                        help='Show only the lines of the given levels.')
+    parser.add_argument('-g', '--grep', type=SimpleSupporter.validateRegEx, default=None,
+                        help='Show only the lines matching the regular expression.')
+    parser.add_argument('-b', '--from-start', action='store_true', help='Read the file from its beginning.')
+    parser.add_argument('-p', '--polling', action='store_true', help='Poll the file instead of using inotify.')
+    parser.add_argument('-r', '--refresh', type=float, default=0.5,
+                        help='The interval in seconds the counters are updated in (default: 0.5).')
+    return parser.parse_args()
+
+
+# ######################################################################################################################
+
+# Main method, entry point
+if __name__ == "__main__":
+    # Check interpreter
+    PythonChecker().check(MIN_PYTHON_VERSION)
+
+    args = parseArgs()
+    follower_g: FileFollower = FileFollower(args.log_file, args.from_start, use_inotify=not args.polling)
+    LogViewer(follower_g, args.level, args.grep, args.refresh).run()
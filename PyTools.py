@@ -1,7 +1,13 @@
 # coding: utf-8
+import bisect
+import ctypes
+import ctypes.util
 import hashlib
+import json
 import math
+import mmap
 import os
+import struct
 import sys
 import time
 import argparse
@@ -9,6 +15,7 @@ import subprocess
 import re
 import platform
 import fnmatch
+import select
 from datetime import datetime
 
 LF = '\n'
@@ -62,13 +69,287 @@ class SmartFormatter(argparse.HelpFormatter):
         return argparse.HelpFormatter._split_lines(self, text, width)
 
 
+# ######################################################################################################################
+# Class of the structured log format definitions shared by the writer and the reader
+class StructuredLog:
+    # Supported record formats
+    FORMAT_JSONL: str = 'jsonl'
+    FORMAT_BINARY: str = 'bin'
+
+    # Log levels, the position in the tuple is the level code of the binary format
+    LEVEL_LOG: str = 'LOG'
+    LEVEL_INFO: str = 'INFO'
+    LEVEL_WARNING: str = 'WARNING'
+    LEVEL_ERROR: str = 'ERROR'
+    LEVEL_INFO_FILE: str = 'INFO-FILE'
+    LEVELS: tuple = (LEVEL_LOG, LEVEL_INFO, LEVEL_WARNING, LEVEL_ERROR, LEVEL_INFO_FILE)
+
+    # File layout
+    INDEX_SUFFIX: str = '.idx'
+    DEFAULT_BUCKET_SIZE: float = 60.0
+    BINARY_MAGIC: bytes = b'PTLB\x02'
+    # Binary record header: message length, timestamp, level code, span length (followed by span and message)
+    BINARY_HEADER: struct.Struct = struct.Struct('<IdBI')
+
+
+# ######################################################################################################################
+# Class for writing structured log records and the sparse sidecar index
+class StructuredLogWriter(PyToolsBase):
+    # General information
+    _NAME = 'Structured Log Writer'
+    _DESCRIPTION = 'The class writes JSON Lines or binary log records with a sparse time and level index.'
+    _VERSION = '0.1.0.0 - 19.10.2026'
+
+    # ##################################################################################################################
+    def __init__(self, log_file: str, fmt: str = StructuredLog.FORMAT_JSONL,
+                 bucket_size: float = StructuredLog.DEFAULT_BUCKET_SIZE):
+        """
+        :param log_file:    The name of the structured log file.
+        :param fmt:         The record format (StructuredLog.FORMAT_JSONL or StructuredLog.FORMAT_BINARY).
+        :param bucket_size: The size of the index time buckets in seconds.
+        :return:            None
+        """
+        # Initialize the base class
+        PyToolsBase.__init__(self, self._NAME, self._VERSION, self._DESCRIPTION)
+
+        if fmt not in (StructuredLog.FORMAT_JSONL, StructuredLog.FORMAT_BINARY):
+            raise Exception('The structured log format "{0}" is not supported.'.format(fmt))
+        if bucket_size <= 0:
+            raise Exception('The index bucket size must be greater than zero.')
+
+        # Store the private members
+        self._log_file: str = log_file
+        self._fmt: str = fmt
+        self._bucket_size: float = float(bucket_size)
+        self._bucket: int = None
+        self._bucket_levels: set = set()
+
+        # Open the log and the index file and write their headers
+        self._fh = open(log_file, 'wb')
+        self._fh.write(StructuredLog.BINARY_MAGIC) if fmt == StructuredLog.FORMAT_BINARY else None
+        self._idx = open(log_file + StructuredLog.INDEX_SUFFIX, 'w')
+        self._idx.write(json.dumps({'format': fmt, 'bucket': self._bucket_size}) + LF)
+        self._idx.flush()
+
+    # ##################################################################################################################
+    def write(self, level: str, text: str, span: str = '', ts: float = None):
+        """
+        :param level:   The log level (one of StructuredLog.LEVELS).
+        :param text:    The message of the record.
+        :param span:    The span the record belongs to.
+        :param ts:      The timestamp of the record, the current time if not given.
+        :return:        None
+        """
+        ts = time.time() if ts is None else ts
+        offset: int = self._fh.tell()
+
+        # The real bucket is indexed even if the clock steps back, the reader detects the unordered index
+        bucket: int = int(ts // self._bucket_size)
+
+        # Index the first record of each time bucket and the first record of each level within the bucket
+        if bucket != self._bucket:
+            self._bucket = bucket
+            self._bucket_levels = set()
+            self._idx.write(json.dumps({'b': bucket, 'o': offset}) + LF)
+        if level not in self._bucket_levels:
+            self._bucket_levels.add(level)
+            self._idx.write(json.dumps({'b': bucket, 'l': level, 'o': offset}) + LF)
+            self._idx.flush()
+
+        # Write the record
+        if self._fmt == StructuredLog.FORMAT_BINARY:
+            span_b: bytes = span.encode('utf-8')
+            text_b: bytes = text.encode('utf-8')
+            self._fh.write(StructuredLog.BINARY_HEADER.pack(len(text_b), ts, StructuredLog.LEVELS.index(level), len(span_b)))
+            self._fh.write(span_b + text_b)
+        else:
+            record: dict = {'ts': ts, 'level': level, 'span': span, 'msg': text}
+            self._fh.write((json.dumps(record, ensure_ascii=False) + LF).encode('utf-8'))
+        self._fh.flush()
+
+    # ##################################################################################################################
+    def close(self):
+        self._fh.close()
+        self._idx.close()
+
+
+# ######################################################################################################################
+# Class for querying structured log files by time range and level
+class StructuredLogReader(PyToolsBase):
+    # General information
+    _NAME = 'Structured Log Reader'
+    _DESCRIPTION = 'The class queries structured log files by time range and level using the sidecar index.'
+    _VERSION = '0.1.0.0 - 19.10.2026'
+
+    # ##################################################################################################################
+    def __init__(self, log_file: str):
+        """
+        :param log_file:    The name of the structured log file.
+        :return:            None
+        """
+        # Initialize the base class
+        PyToolsBase.__init__(self, self._NAME, self._VERSION, self._DESCRIPTION)
+
+        # Map the log file into memory (an empty file cannot be mapped)
+        self._log_file: str = log_file
+        self._fh = open(log_file, 'rb')
+        self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(log_file) else b''
+
+        # Detect the format by the file header
+        is_binary: bool = self._mm[:len(StructuredLog.BINARY_MAGIC)] == StructuredLog.BINARY_MAGIC
+        self.format: str = StructuredLog.FORMAT_BINARY if is_binary else StructuredLog.FORMAT_JSONL
+        self._data_start: int = len(StructuredLog.BINARY_MAGIC) if is_binary else 0
+
+        # Load the sparse index if available, each entry is a byte range (bucket, start, stop) in file order
+        self._bucket_size: float = StructuredLog.DEFAULT_BUCKET_SIZE
+        self._buckets: list = list()
+        self._levels: dict = dict()
+        self._indexed: bool = self.__loadIndex__(log_file + StructuredLog.INDEX_SUFFIX)
+
+        # Number of records decoded by the queries
+        self.decoded: int = 0
+
+    # ##################################################################################################################
+    def __enter__(self):
+        return self
+
+    # ##################################################################################################################
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ##################################################################################################################
+    def close(self):
+        self._mm.close() if isinstance(self._mm, mmap.mmap) else None
+        self._fh.close()
+
+    # ##################################################################################################################
+    def query(self, start: float = None, end: float = None, level: str = None):
+        """
+        :param start:   The start of the time range (seconds since the epoch), unbounded if not given.
+        :param end:     The end of the time range (seconds since the epoch), unbounded if not given.
+        :param level:   The log level to be selected, all levels if not given.
+        :return:        Generator of the matching records as dict (ts, level, span, msg)
+        """
+        first_bucket: int = int(start // self._bucket_size) if start is not None else None
+        last_bucket: int = int(end // self._bucket_size) if end is not None else None
+
+        # Without an index the whole file has to be scanned
+        if not self._indexed:
+            yield from self.__scan__(self._data_start, len(self._mm), start, end, level)
+            return
+
+        # Visit only the ranges of the buckets in the time range (which contain records of the given level)
+        entries: list = self._buckets if level is None else self._levels.get(level, list())
+        for range_start, range_stop in self.__ranges__(entries, first_bucket, last_bucket):
+            yield from self.__scan__(range_start, range_stop, start, end, level)
+
+    # ##################################################################################################################
+    def __loadIndex__(self, index_file: str) -> bool:
+        if not os.path.isfile(index_file):
+            return False
+
+        bucket_entries: list = list()
+        level_entries: list = list()
+        with open(index_file, 'r') as fh:
+            for i, line in enumerate(fh):
+                try:
+                    entry: dict = json.loads(line)
+                except ValueError:
+                    # A partially written last line of a running log
+                    break
+                if i == 0:
+                    self._bucket_size = float(entry['bucket'])
+                elif 'l' in entry:
+                    level_entries.append((entry['l'], entry['b'], entry['o']))
+                else:
+                    bucket_entries.append((entry['b'], entry['o']))
+
+        # A bucket range ends where the next one starts. The buckets need not be ascending if the clock stepped back,
+        # but the offsets always are.
+        offsets: list = [offset for _, offset in bucket_entries]
+        stops: list = offsets[1:] + [len(self._mm)]
+        self._buckets = [(bucket, offset, stop) for (bucket, offset), stop in zip(bucket_entries, stops)]
+
+        # A level range ends with the bucket range containing it
+        for level, bucket, offset in level_entries:
+            i: int = bisect.bisect_right(offsets, offset) - 1
+            self._levels.setdefault(level, list()).append((bucket, offset, stops[i] if i >= 0 else len(self._mm)))
+
+        return True
+
+    # ##################################################################################################################
+    @staticmethod
+    def __ranges__(entries: list, first_bucket: int, last_bucket: int):
+        # Select the ranges of the buckets in [first_bucket, last_bucket] in file order and merge the adjacent ones
+        range_start, range_stop = None, None
+        for bucket, start, stop in entries:
+            if (first_bucket is not None and bucket < first_bucket) or (last_bucket is not None and bucket > last_bucket):
+                continue
+            if start == range_stop:
+                range_stop = stop
+                continue
+            if range_start is not None:
+                yield range_start, range_stop
+            range_start, range_stop = start, stop
+        if range_start is not None:
+            yield range_start, range_stop
+
+    # ##################################################################################################################
+    def __scan__(self, pos: int, stop: int, start: float, end: float, level: str):
+        mm = self._mm
+        header: struct.Struct = StructuredLog.BINARY_HEADER
+        while pos < stop:
+            # Decode the next record
+            if self.format == StructuredLog.FORMAT_BINARY:
+                if pos + header.size > stop:
+                    break
+                text_len, ts, lvl, span_len = header.unpack_from(mm, pos)
+                span_pos: int = pos + header.size
+                if span_pos + span_len + text_len > stop:
+                    break
+                try:
+                    record: dict = {'ts': ts, 'level': StructuredLog.LEVELS[lvl],
+                                    'span': mm[span_pos:span_pos + span_len].decode('utf-8'),
+                                    'msg': mm[span_pos + span_len:span_pos + span_len + text_len].decode('utf-8')}
+                except (IndexError, ValueError):
+                    record = None
+                next_pos: int = span_pos + span_len + text_len
+            else:
+                eol: int = mm.find(b'\n', pos, stop)
+                if eol < 0:
+                    break
+                try:
+                    record: dict = json.loads(mm[pos:eol])
+                except ValueError:
+                    record = None
+                next_pos: int = eol + 1
+
+            # Check whether the record could not be decoded
+            if not isinstance(record, dict) or 'ts' not in record or 'level' not in record:
+                raise Exception('The file {0} is not a valid structured log file (offset {1}).'.format(self._log_file, pos))
+            pos = next_pos
+            self.decoded += 1
+
+            # Filter the record
+            if level is not None and record['level'] != level:
+                continue
+            if start is not None and record['ts'] < start:
+                continue
+            if end is not None and record['ts'] > end:
+                continue
+            yield record
+
+
 # ######################################################################################################################
 # Class for logging information, warnings and errors
 class Logger(PyToolsBase):
     # General information
     _NAME = 'Logger'
     _DESCRIPTION = 'The class provides method for logging information, warnings and errors to the console.'
-    _VERSION = '0.3.0.0 - 09.11.2022'
+    _VERSION = '0.4.0.0 - 19.10.2026'
+
+    # Prefix of the log levels in the text output
+    _RX_LEVEL_PREFIX: re = re.compile(r'^\[[A-Z\-]+\]: ')
 
     # ##################################################################################################################
     def __init__(self):
@@ -80,6 +361,9 @@ class Logger(PyToolsBase):
 
         # Store the private members
         self._log_file: str = None
+        self._struct_log: StructuredLogWriter = None
+        self._span: str = ''
+        self._spans: list = list()
 
         # Time measurement variables
         self._start_time: float = time.time()
@@ -101,6 +385,26 @@ class Logger(PyToolsBase):
         log_str += r'===========================================================================' + LF
         open(self._log_file, 'w').write(log_str)
 
+    # ##################################################################################################################
+    def setStructuredLogFile(self, log_file: str, fmt: str = StructuredLog.FORMAT_JSONL,
+                             bucket_size: float = StructuredLog.DEFAULT_BUCKET_SIZE):
+        """
+        :param log_file:    The name of the structured log file (the sparse index is written to <log_file>.idx).
+        :param fmt:         The record format (StructuredLog.FORMAT_JSONL or StructuredLog.FORMAT_BINARY).
+        :param bucket_size: The size of the index time buckets in seconds.
+        :return:            None
+        """
+        self._struct_log.close() if self._struct_log else None
+        self._struct_log = StructuredLogWriter(log_file, fmt, bucket_size) if log_file else None
+
+    # ##################################################################################################################
+    def setSpan(self, span: str = ''):
+        """
+        :param span:        The span stored with the following structured log records.
+        :return:            None
+        """
+        self._span = span
+
     # ##################################################################################################################
     def setLogOn(self, flag: bool = True):
         """
@@ -141,7 +445,9 @@ class Logger(PyToolsBase):
         :return:        None
         """
         self._start_time = time.time()
-        self._log('[INFO]: ' + text + ('...' if dots else ''))
+        self._spans.append(self._span)
+        self._span = text
+        self._log('[INFO]: ' + text + ('...' if dots else ''), level=StructuredLog.LEVEL_INFO)
 
     # ##################################################################################################################
     def logInfoEnd(self, text=None, errs=None):
@@ -152,12 +458,13 @@ class Logger(PyToolsBase):
         """
         if errs is None or len(errs) == 0:
             output = (' Done ({:.3f} s, ' + text + ')' if text else ' Done ({:.3f} s)') + LF
-            self._log(output.format((time.time() - self._start_time)))
+            self._log(output.format((time.time() - self._start_time)), level=StructuredLog.LEVEL_INFO)
         else:
             output = (' Error ({:.3f} s, ' + text + ')' if text else ' Error ({:.3f} s)') + LF
-            self._log(output.format((time.time() - self._start_time)))
+            self._log(output.format((time.time() - self._start_time)), level=StructuredLog.LEVEL_ERROR)
             for err in errs:
                 self.logErr(err)
+        self._span = self._spans.pop() if self._spans else self._span
 
     # ##################################################################################################################
     def log(self, text):
@@ -173,7 +480,7 @@ class Logger(PyToolsBase):
         :param text:    Information text to be logged.
         :return:        None
         """
-        self._log('[INFO]: ' + text + LF)
+        self._log('[INFO]: ' + text + LF, level=StructuredLog.LEVEL_INFO)
 
     # ##################################################################################################################
     def logErr(self, text):
@@ -181,7 +488,7 @@ class Logger(PyToolsBase):
         :param text:    Error text to be logged.
         :return:        None
         """
-        self._log('[ERROR]: ' + text + LF)
+        self._log('[ERROR]: ' + text + LF, level=StructuredLog.LEVEL_ERROR)
 
     # ##################################################################################################################
     def logWarn(self, text):
@@ -189,7 +496,7 @@ class Logger(PyToolsBase):
         :param text:    Warning text to be logged.
         :return:        None
         """
-        self._log('[WARNING]: ' + text + LF)
+        self._log('[WARNING]: ' + text + LF, level=StructuredLog.LEVEL_WARNING)
 
     # ##################################################################################################################
     def logInfoFileOnly(self, text):
@@ -199,6 +506,7 @@ class Logger(PyToolsBase):
         """
         # Log to file if necessary
         open(self._log_file, 'a+').write('[INFO-FILE]: ' + text + LF) if self._log_file else None
+        self._struct_log.write(StructuredLog.LEVEL_INFO_FILE, text.strip(), self._span) if self._struct_log else None
 
     # ##################################################################################################################
     def progress(self, count, total, suffix=''):
@@ -212,10 +520,12 @@ class Logger(PyToolsBase):
         self._log('[%s] %s%s (%s/%s)  %s\r' % (bar, percents, '%', count, total, suffix), (True if total == count else False))
 
     # ##################################################################################################################
-    def _log(self, text, log_to_file: bool = True):
+    def _log(self, text, log_to_file: bool = True, level: str = StructuredLog.LEVEL_LOG):
         """
-        :param text:    Text to be logged.
-        :return:        None
+        :param text:        Text to be logged.
+        :param log_to_file: True logs to the log files else to the console only.
+        :param level:       The log level of the structured log record.
+        :return:            None
         """
         # Write to standard out
         if self._log_on:
@@ -225,6 +535,10 @@ class Logger(PyToolsBase):
         # Log to file if necessary
         open(self._log_file, 'a+').write(text) if self._log_file and log_to_file else None
 
+        # Write the structured log record if necessary
+        if self._struct_log and log_to_file:
+            self._struct_log.write(level, self._RX_LEVEL_PREFIX.sub('', text.strip()), self._span)
+
 
 # ######################################################################################################################
 # Class for special file system functionalities
@@ -320,6 +634,178 @@ class FS(PyToolsBase):
         return os.path.getsize(file)
 
 
+# ######################################################################################################################
+# Class for following a growing file incrementally
+class FileFollower(PyToolsBase):
+    # General information
+    _NAME = 'File Follower'
+    _DESCRIPTION = 'The class follows a growing file from the last read offset using inotify or polling.'
+    _VERSION = '0.1.0.0 - 19.10.2026'
+
+    # Follow modes
+    MODE_INOTIFY: str = 'inotify'
+    MODE_POLLING: str = 'polling'
+
+    # inotify constants (see <sys/inotify.h>)
+    _IN_MODIFY: int = 0x00000002
+    _IN_ATTRIB: int = 0x00000004
+    _IN_CLOSE_WRITE: int = 0x00000008
+    _IN_DELETE_SELF: int = 0x00000400
+    _IN_MOVE_SELF: int = 0x00000800
+    _IN_NONBLOCK: int = 0o4000
+    _IN_CLOEXEC: int = 0o2000000
+
+    # ##################################################################################################################
+    def __init__(self, file_name: str, from_start: bool = False, max_line: int = 64 * 1024, use_inotify: bool = True):
+        """
+        :param file_name:   The name of the file to be followed.
+        :param from_start:  True reads the file from the beginning else only the lines appended from now on.
+        :param max_line:    Lines longer than this number of bytes are split into several lines.
+        :param use_inotify: True uses inotify where available else polling.
+        :return:            None
+        """
+        # Initialize the base class
+        PyToolsBase.__init__(self, self._NAME, self._VERSION, self._DESCRIPTION)
+
+        # Store the private members
+        self.file_name: str = FS.fileExpandAndExists(file_name)
+        self.offset: int = 0
+        self._max_line: int = max_line
+        self._partial: bytes = b''
+        self._skip_line: bool = False
+        self._fh = None
+        self._inode: int = None
+        self._libc = None
+        self._inotify_fd: int = -1
+        self._inotify_wd: int = -1
+
+        # Open the file and set up the change notification
+        self.mode: str = self.MODE_INOTIFY if use_inotify and self.__initInotify__() else self.MODE_POLLING
+        self.__open__(from_start)
+
+    # ##################################################################################################################
+    def read(self, max_bytes: int = 1024 * 1024) -> list:
+        """
+        :param max_bytes:   The maximum number of bytes read by one call.
+        :return:            The complete lines (bytes without line feed) appended since the last call.
+        """
+        while True:
+            data: bytes = self._fh.read(max_bytes)
+            if not data:
+                # Only check for a rotated or truncated file if there is no more data to be read
+                return self.read(max_bytes) if self.__checkFile__() else list()
+            self.offset += len(data)
+            if not self._skip_line:
+                break
+
+            # Skip the rest of the line the following started within (as tail -f does)
+            eol: int = data.find(b'\n')
+            if eol >= 0:
+                self._skip_line = False
+                data = data[eol + 1:]
+                if data:
+                    break
+
+        # Keep the incomplete last line for the next call, only its full max_line chunks are returned early. The
+        # remainder is never empty, so the line feed completing the line does not return an empty line.
+        buffer: bytes = self._partial + data if self._partial else data
+        lines: list = buffer.split(b'\n')
+        self._partial = lines.pop()
+        if len(self._partial) > self._max_line:
+            split_pos: int = (len(self._partial) - 1) // self._max_line * self._max_line
+            lines.append(self._partial[:split_pos])
+            self._partial = self._partial[split_pos:]
+
+        # Split the long lines, this is only checked if the buffer could contain one
+        max_line: int = self._max_line
+        if len(buffer) > max_line and any(len(line) > max_line for line in lines):
+            lines = [line[i:i + max_line] for line in lines for i in range(0, max(len(line), 1), max_line)]
+
+        return lines
+
+    # ##################################################################################################################
+    def wait(self, timeout: float):
+        """
+        :param timeout:     The maximum time in seconds to wait for a change of the file.
+        :return:            None
+        """
+        if self.mode == self.MODE_INOTIFY:
+            if select.select([self._inotify_fd], [], [], timeout)[0]:
+                # Drain the pending events, the content is not needed
+                try:
+                    while os.read(self._inotify_fd, 4096):
+                        pass
+                except BlockingIOError:
+                    pass
+        else:
+            time.sleep(timeout)
+
+    # ##################################################################################################################
+    def close(self):
+        self._fh.close() if self._fh else None
+        os.close(self._inotify_fd) if self._inotify_fd >= 0 else None
+        self._fh, self._inotify_fd = None, -1
+
+    # ##################################################################################################################
+    def __open__(self, from_start: bool):
+        self._fh.close() if self._fh else None
+        self._fh = open(self.file_name, 'rb')
+        self._inode = os.fstat(self._fh.fileno()).st_ino
+        self._partial = b''
+        self._skip_line = False
+        self.offset = 0
+        if not from_start:
+            # Check whether the end of the file is within a line, its rest is skipped
+            end: int = self._fh.seek(0, os.SEEK_END)
+            if end > 0:
+                self._fh.seek(end - 1)
+                self._skip_line = self._fh.read(1) != b'\n'
+            self.offset = end
+
+        # Watch the newly opened file
+        if self.mode == self.MODE_INOTIFY:
+            self._libc.inotify_rm_watch(self._inotify_fd, self._inotify_wd) if self._inotify_wd >= 0 else None
+            mask: int = self._IN_MODIFY | self._IN_ATTRIB | self._IN_CLOSE_WRITE | self._IN_DELETE_SELF | self._IN_MOVE_SELF
+            self._inotify_wd = self._libc.inotify_add_watch(self._inotify_fd, self.file_name.encode(), mask)
+            if self._inotify_wd < 0:
+                # E.g. the limit of watches is reached, fall back to polling
+                self.mode = self.MODE_POLLING
+
+    # ##################################################################################################################
+    def __checkFile__(self) -> bool:
+        try:
+            st = os.stat(self.file_name)
+        except FileNotFoundError:
+            # The file is being rotated, keep the current one until the new file exists
+            return False
+
+        if st.st_ino != self._inode:
+            # The file has been replaced, follow the new file from its beginning
+            self.__open__(True)
+        elif st.st_size < self.offset:
+            # The file has been truncated
+            self.offset = self._fh.seek(0)
+            self._partial = b''
+            self._skip_line = False
+        else:
+            return False
+
+        return True
+
+    # ##################################################################################################################
+    def __initInotify__(self) -> bool:
+        if platform.system() != 'Linux':
+            return False
+
+        try:
+            self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            self._inotify_fd = self._libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+
+        return self._inotify_fd >= 0
+
+
 # ######################################################################################################################
 # Class for system process functionalities
 class ProcessHelper(PyToolsBase):
@@ -67,13 +67,19 @@ class Logger_(PyToolsBase):
 
     # ######################################################################################################################
     def log(self, text: str):
-        # Append the given text
-        self._body.append(text)
+        self.logLines([text])
+
+    # ######################################################################################################################
+    def logLines(self, texts: list):
+        # Append the given texts, the screen is redrawn only once for all of them
+        if not texts:
+            return
+        self._body.extend(texts)
 
         # Check whether end of body window has been reached.
         if len(self._body) >= self._body_size:
-            # Remove the first line of the body and scroll one line up
-            self._body.pop(0)
+            # Remove the first lines of the body and scroll one line up
+            del self._body[:len(self._body) - self._body_size + 1]
             self.__moveCur__(self._scr_size_y, self.TERM_OFFSET)
 
             # Move the cursor to the top of the window and display the body, border and tailer
@@ -143,8 +149,6 @@ class Logger_(PyToolsBase):
         sys.stdout.flush()
 
 
-logger1_g: Logger_ = Logger_(3)
-
 # ######################################################################################################################
 
 # Main method, entry point
@@ -152,6 +156,9 @@ if __name__ == "__main__":
     # Check interpreter
     PythonChecker().check(MIN_PYTHON_VERSION)
 
+    # Create the split screen logger here, importing the module must not touch the terminal
+    logger1_g: Logger_ = Logger_(3)
+
     body_idx: int = 0
     for idx in range(1000):
         if (idx % 1) == 0:
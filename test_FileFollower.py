@@ -0,0 +1,131 @@
+# coding: utf-8
+import os
+import shutil
+import tempfile
+import unittest
+
+from PyTools import FileFollower
+
+
+# ######################################################################################################################
+# Tests of the file follower in polling and inotify mode
+class FileFollowerTest(unittest.TestCase):
+    # ##################################################################################################################
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.log_file = os.path.join(self.tmp_dir, 'follow.log')
+        open(self.log_file, 'wb').close()
+
+    # ##################################################################################################################
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    # ##################################################################################################################
+    def append(self, data: bytes):
+        open(self.log_file, 'ab').write(data)
+
+    # ##################################################################################################################
+    def modes(self) -> list:
+        # The inotify mode is only tested where it is available
+        follower = FileFollower(self.log_file)
+        follower.close()
+        return [False, True] if follower.mode == FileFollower.MODE_INOTIFY else [False]
+
+    # ##################################################################################################################
+    def follow(self, test, **kwargs):
+        # Run the test with a new follower of a freshly written file per mode
+        for use_inotify in self.modes():
+            with self.subTest(use_inotify=use_inotify):
+                open(self.log_file, 'wb').write(b'old 1\nold 2\n')
+                test(lambda: FileFollower(self.log_file, use_inotify=use_inotify, **kwargs))
+
+    # ##################################################################################################################
+    def testAppendAndPartialLine(self):
+        def test(create):
+            follower = create()
+            self.assertEqual(follower.read(), [])
+            self.append(b'a\nb')
+            self.assertEqual(follower.read(), [b'a'])
+            self.assertEqual(follower.read(), [])
+            self.append(b'c\n')
+            self.assertEqual(follower.read(), [b'bc'])
+            self.assertEqual(follower.offset, os.path.getsize(self.log_file))
+            follower.close()
+        self.follow(test)
+
+    # ##################################################################################################################
+    def testFromStart(self):
+        def test(create):
+            follower = create()
+            self.assertEqual(follower.read(), [b'old 1', b'old 2'])
+            follower.close()
+        self.follow(test, from_start=True)
+
+    # ##################################################################################################################
+    def testStartWithinLine(self):
+        def test(create):
+            self.append(b'[ERROR]: cut')
+            follower = create()
+            self.append(b' rest')
+            self.assertEqual(follower.read(), [])
+            self.append(b'\n[INFO]: next\n')
+            self.assertEqual(follower.read(), [b'[INFO]: next'])
+            follower.close()
+        self.follow(test)
+
+    # ##################################################################################################################
+    def testTruncate(self):
+        def test(create):
+            follower = create()
+            self.append(b'a\n')
+            self.assertEqual(follower.read(), [b'a'])
+            open(self.log_file, 'wb').write(b'new\n')
+            self.assertEqual(follower.read(), [b'new'])
+            self.assertEqual(follower.offset, 4)
+            follower.close()
+        self.follow(test)
+
+    # ##################################################################################################################
+    def testRenameAndRecreate(self):
+        def test(create):
+            follower = create()
+            self.append(b'a\nrest of old')
+            os.rename(self.log_file, self.log_file + '.1')
+            open(self.log_file, 'wb').write(b'new 1\nnew 2\n')
+            self.assertEqual(follower.read(), [b'a'])
+            self.assertEqual(follower.read(), [b'new 1', b'new 2'])
+
+            # The change notification follows the new file
+            follower.wait(0.01)
+            self.append(b'new 3\n')
+            follower.wait(1.0)
+            self.assertEqual(follower.read(), [b'new 3'])
+            follower.close()
+        self.follow(test)
+
+    # ##################################################################################################################
+    def testMaxLine(self):
+        def test(create):
+            follower = create()
+
+            # A complete long line is split
+            self.append(b'x' * 25 + b'\nshort\n')
+            self.assertEqual(follower.read(), [b'x' * 10, b'x' * 10, b'x' * 5, b'short'])
+
+            # Only full chunks of an incomplete long line are returned, independent of the read timing
+            self.append(b'z' * 23)
+            self.assertEqual(follower.read(), [b'z' * 10, b'z' * 10])
+            self.append(b'zz\n')
+            self.assertEqual(follower.read(), [b'z' * 5])
+
+            # A line of a multiple of max_line does not produce an empty line
+            self.append(b'y' * 20)
+            self.assertEqual(follower.read(), [b'y' * 10])
+            self.append(b'\n')
+            self.assertEqual(follower.read(), [b'y' * 10])
+            follower.close()
+        self.follow(test, max_line=10)
+
+
+if __name__ == '__main__':
+    unittest.main()
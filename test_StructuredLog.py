@@ -0,0 +1,98 @@
+# coding: utf-8
+import json
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from PyTools import Logger, StructuredLog, StructuredLogReader, StructuredLogWriter
+
+
+# ######################################################################################################################
+# Tests of the structured log writer and reader
+class StructuredLogTest(unittest.TestCase):
+    # ##################################################################################################################
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    # ##################################################################################################################
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    # ##################################################################################################################
+    def writeLog(self, fmt: str, step_back: bool) -> tuple:
+        # Write the same records into an indexed log and a copy without index
+        rnd = random.Random(42)
+        log_file: str = os.path.join(self.tmp_dir, 'indexed.' + fmt)
+        writer = StructuredLogWriter(log_file, fmt, bucket_size=10)
+        ts: float = 1000.0
+        for i in range(2000):
+            ts += rnd.uniform(0.0, 1.0)
+            if step_back and i % 97 == 0:
+                ts -= rnd.uniform(5.0, 40.0)
+            writer.write(rnd.choice(StructuredLog.LEVELS), 'msg {0}'.format(i), 'span', ts)
+        writer.close()
+
+        plain_file: str = os.path.join(self.tmp_dir, 'plain.' + fmt)
+        shutil.copyfile(log_file, plain_file)
+        return log_file, plain_file
+
+    # ##################################################################################################################
+    def testIndexedEqualsUnindexed(self):
+        rnd = random.Random(7)
+        for fmt in (StructuredLog.FORMAT_JSONL, StructuredLog.FORMAT_BINARY):
+            for step_back in (False, True):
+                log_file, plain_file = self.writeLog(fmt, step_back)
+                with StructuredLogReader(log_file) as indexed, StructuredLogReader(plain_file) as plain:
+                    self.assertTrue(indexed._indexed)
+                    self.assertFalse(plain._indexed)
+
+                    # A narrow time range only decodes a few buckets, also after the clock stepped back
+                    self.assertEqual(list(indexed.query(1500.0, 1510.0)), list(plain.query(1500.0, 1510.0)))
+                    self.assertLess(indexed.decoded, plain.decoded // 10, (fmt, step_back))
+
+                    for _ in range(100):
+                        start: float = rnd.choice([None, rnd.uniform(900.0, 2100.0)])
+                        end: float = rnd.choice([None, rnd.uniform(900.0, 2100.0)])
+                        level: str = rnd.choice((None,) + StructuredLog.LEVELS)
+                        self.assertEqual(list(indexed.query(start, end, level)), list(plain.query(start, end, level)),
+                                         (fmt, step_back, start, end, level))
+
+    # ##################################################################################################################
+    def testLoggerRecords(self):
+        log_file: str = os.path.join(self.tmp_dir, 'logger.bin')
+        logger = Logger()
+        logger.setLogOn(False)
+        logger.setStructuredLogFile(log_file, StructuredLog.FORMAT_BINARY)
+        logger.setSpan('job-42')
+        logger.logInfoStart('s' * 70000)
+        logger.logInfoStart('nested')
+        logger.logInfoEnd()
+        logger.logInfoEnd()
+        logger.logInfo('b')
+        logger.logInfoFileOnly('file only')
+        logger.setStructuredLogFile('')
+
+        with StructuredLogReader(log_file) as reader:
+            records: list = list(reader.query())
+        self.assertEqual(len(records[0]['span']), 70000)
+        self.assertEqual([record['span'] for record in records[1:3]], ['nested', 'nested'])
+        self.assertEqual(len(records[3]['span']), 70000)
+        self.assertEqual((records[4]['msg'], records[4]['span']), ('b', 'job-42'))
+        self.assertEqual((records[5]['level'], records[5]['msg']), (StructuredLog.LEVEL_INFO_FILE, 'file only'))
+
+    # ##################################################################################################################
+    def testInvalidFile(self):
+        log_file: str = os.path.join(self.tmp_dir, 'text.log')
+        open(log_file, 'w').write('[INFO]: not a structured log' + os.linesep)
+        with StructuredLogReader(log_file) as reader:
+            self.assertRaises(Exception, lambda: list(reader.query()))
+
+        open(log_file, 'w').write(json.dumps([1, 2]) + os.linesep)
+        with StructuredLogReader(log_file) as reader:
+            self.assertRaises(Exception, lambda: list(reader.query()))
+
+
+if __name__ == '__main__':
+    unittest.main()